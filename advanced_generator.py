@@ -3,8 +3,43 @@ Advanced password generator with pattern-based generation
 """
 
 import secrets
+import string
 from typing import List, Optional
-from password_generator import PasswordGenerator
+from password_generator import PasswordGenerator, _random_chars, _random_indices
+
+# Shared CSPRNG instance; SystemRandom holds no state worth re-creating
+_SYSRAND = secrets.SystemRandom()
+
+# Pattern letters understood by generate_pattern_password
+_PATTERN_MAP = {
+    'l': string.ascii_lowercase,
+    'u': string.ascii_uppercase,
+    'd': string.digits,
+    's': string.punctuation
+}
+
+# Common syllable patterns for pronounceable passwords
+_SYLLABLES = (
+    'ba', 'be', 'bi', 'bo', 'bu', 'ca', 'ce', 'ci', 'co', 'cu',
+    'da', 'de', 'di', 'do', 'du', 'fa', 'fe', 'fi', 'fo', 'fu',
+    'ga', 'ge', 'gi', 'go', 'gu', 'ha', 'he', 'hi', 'ho', 'hu',
+    'ja', 'je', 'ji', 'jo', 'ju', 'ka', 'ke', 'ki', 'ko', 'ku',
+    'la', 'le', 'li', 'lo', 'lu', 'ma', 'me', 'mi', 'mo', 'mu',
+    'na', 'ne', 'ni', 'no', 'nu', 'pa', 'pe', 'pi', 'po', 'pu',
+    'ra', 're', 'ri', 'ro', 'ru', 'sa', 'se', 'si', 'so', 'su',
+    'ta', 'te', 'ti', 'to', 'tu', 'va', 've', 'vi', 'vo', 'vu',
+    'za', 'ze', 'zi', 'zo', 'zu', 'cha', 'che', 'chi', 'cho', 'chu',
+    'sha', 'she', 'shi', 'sho', 'shu', 'tha', 'the', 'thi', 'tho', 'thu'
+)
+
+# Common words for passphrases
+_DEFAULT_WORDS = (
+    'apple', 'river', 'mountain', 'sunshine', 'whisper', 'crystal',
+    'forest', 'ocean', 'butterfly', 'thunder', 'silence', 'journey',
+    'garden', 'mirror', 'shadow', 'diamond', 'freedom', 'harmony',
+    'victory', 'wonder', 'courage', 'passion', 'mystery', 'treasure',
+    'horizon', 'melody', 'twilight', 'destiny', 'infinity', 'universe'
+)
 
 
 class AdvancedPasswordGenerator(PasswordGenerator):
@@ -27,25 +62,16 @@ class AdvancedPasswordGenerator(PasswordGenerator):
         Returns:
             Memorable password string
         """
-        # Common syllable patterns for pronounceable passwords
-        syllables = [
-            'ba', 'be', 'bi', 'bo', 'bu', 'ca', 'ce', 'ci', 'co', 'cu',
-            'da', 'de', 'di', 'do', 'du', 'fa', 'fe', 'fi', 'fo', 'fu',
-            'ga', 'ge', 'gi', 'go', 'gu', 'ha', 'he', 'hi', 'ho', 'hu',
-            'ja', 'je', 'ji', 'jo', 'ju', 'ka', 'ke', 'ki', 'ko', 'ku',
-            'la', 'le', 'li', 'lo', 'lu', 'ma', 'me', 'mi', 'mo', 'mu',
-            'na', 'ne', 'ni', 'no', 'nu', 'pa', 'pe', 'pi', 'po', 'pu',
-            'ra', 're', 'ri', 'ro', 'ru', 'sa', 'se', 'si', 'so', 'su',
-            'ta', 'te', 'ti', 'to', 'tu', 'va', 've', 'vi', 'vo', 'vu',
-            'za', 'ze', 'zi', 'zo', 'zu', 'cha', 'che', 'chi', 'cho', 'chu',
-            'sha', 'she', 'shi', 'sho', 'shu', 'tha', 'the', 'thi', 'tho', 'thu'
-        ]
+        # Draw all randomness up front: a 2-or-3 choice per word, enough
+        # syllables for three per word, and the trailing number
+        syllable_counts = _random_indices(2, word_count)
+        syllables = iter(_random_indices(len(_SYLLABLES), 3 * word_count))
+        number = _random_indices(90, 1)[0] + 10  # 10-99
         
         words = []
-        for _ in range(word_count):
+        for extra in syllable_counts:
             # Create word-like pattern (2-3 syllables)
-            syllable_count = secrets.choice([2, 3])
-            word = ''.join(secrets.choice(syllables) for _ in range(syllable_count))
+            word = ''.join([_SYLLABLES[next(syllables)] for _ in range(2 + extra)])
             
             if capitalize:
                 word = word.capitalize()
@@ -53,7 +79,7 @@ class AdvancedPasswordGenerator(PasswordGenerator):
             words.append(word)
         
         # Add a random number at the end for extra security
-        words.append(str(secrets.randbelow(90) + 10))  # 10-99
+        words.append(str(number))
         
         return separator.join(words)
     
@@ -68,20 +94,23 @@ class AdvancedPasswordGenerator(PasswordGenerator):
         Returns:
             Pattern-based password
         """
-        char_map = {
-            'l': string.ascii_lowercase,
-            'u': string.ascii_uppercase,
-            'd': string.digits,
-            's': string.punctuation
+        # Draw each class's characters in one batch, then place them in order
+        draws = {
+            char_type: iter(_random_chars(chars, pattern.count(char_type)))
+            for char_type, chars in _PATTERN_MAP.items()
+            if char_type in pattern
         }
         
+        # Unrecognized pattern characters draw from the default set;
+        # configure it once rather than for every such character
+        if any(char_type not in _PATTERN_MAP for char_type in pattern):
+            self.configure_character_set()
+        
         password = []
         for char_type in pattern:
-            if char_type in char_map:
-                password.append(secrets.choice(char_map[char_type]))
+            if char_type in draws:
+                password.append(next(draws[char_type]))
             else:
-                # If pattern character not recognized, use all available
-                self.configure_character_set()
                 password.append(secrets.choice(self.available_chars))
         
         return ''.join(password)
@@ -102,19 +131,12 @@ class AdvancedPasswordGenerator(PasswordGenerator):
             Generated passphrase
         """
         if word_list is None:
-            # Common words for passphrases
-            word_list = [
-                'apple', 'river', 'mountain', 'sunshine', 'whisper', 'crystal',
-                'forest', 'ocean', 'butterfly', 'thunder', 'silence', 'journey',
-                'garden', 'mirror', 'shadow', 'diamond', 'freedom', 'harmony',
-                'victory', 'wonder', 'courage', 'passion', 'mystery', 'treasure',
-                'horizon', 'melody', 'twilight', 'destiny', 'infinity', 'universe'
-            ]
+            word_list = _DEFAULT_WORDS
         
         if len(word_list) < word_count:
             raise ValueError("Word list too small for requested passphrase")
         
-        words = secrets.SystemRandom().sample(word_list, word_count)
+        words = _SYSRAND.sample(word_list, word_count)
         return separator.join(words)
 
 
@@ -2,13 +2,18 @@
 Command Line Interface for Password Generator
 """
 
-import argparse
 import sys
-from typing import List
+from types import SimpleNamespace
+from typing import List, Optional
 from password_generator import PasswordGenerator
 
+DEFAULT_CHAR_TYPES = ['lowercase', 'uppercase', 'digits', 'symbols']
+
 def parse_arguments():
     """Parse command line arguments"""
+    # Imported here so the fast path and library imports skip argparse
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Secure Password Generator',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -31,7 +36,7 @@ Examples:
         '-c', '--char-types',
         nargs='+',
         choices=['lowercase', 'uppercase', 'digits', 'symbols', 'hex', 'alphanumeric'],
-        default=['lowercase', 'uppercase', 'digits', 'symbols'],
+        default=DEFAULT_CHAR_TYPES,
         help='Character types to include'
     )
     
@@ -56,9 +61,37 @@ Examples:
     
     return parser.parse_args()
 
+def parse_fast_arguments(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the common invocations without building an ArgumentParser
+    
+    Handles no arguments and a lone '-l N' / '--length N'. Anything else
+    returns None so the caller can fall back to parse_arguments().
+    
+    Args:
+        argv: Command line arguments, excluding the program name
+        
+    Returns:
+        Namespace matching parse_arguments() defaults, or None
+    """
+    if not argv:
+        length = 16
+    elif len(argv) == 2 and argv[0] in ('-l', '--length') and argv[1].isdecimal():
+        length = int(argv[1])
+    else:
+        return None
+    
+    return SimpleNamespace(
+        length=length,
+        char_types=DEFAULT_CHAR_TYPES,
+        custom=None,
+        count=1,
+        no_strength_check=False
+    )
+
 def main():
     """Main CLI function"""
-    args = parse_arguments()
+    args = parse_fast_arguments(sys.argv[1:]) or parse_arguments()
     
     try:
         generator = PasswordGenerator()
@@ -89,8 +122,9 @@ def main():
         else:
             passwords = generator.generate_multiple_passwords(args.length, args.count)
             print(f"\nGenerated {args.count} passwords:")
-            for i, password in enumerate(passwords, 1):
-                print(f"{i:2d}. {password}")
+            # Build the whole listing and write it once instead of per line
+            lines = [f"{i:2d}. {password}\n" for i, password in enumerate(passwords, 1)]
+            sys.stdout.write(''.join(lines))
     
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -4,9 +4,20 @@ Simple GUI Interface for Password Generator
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import pyperclip  # For clipboard functionality
 from password_generator import PasswordGenerator
 
+# Strength analysis layout, filled in by show_strength_analysis
+_ANALYSIS_TEMPLATE = (
+    "Password Strength Analysis:\n\n"
+    "Length: {length} characters\n"
+    "Contains lowercase: {lowercase}\n"
+    "Contains uppercase: {uppercase}\n"
+    "Contains digits: {digits}\n"
+    "Contains symbols: {symbols}\n\n"
+    "Overall strength: {overall}"
+)
+_YES, _NO = '✓ Yes', '✗ No'
+
 class PasswordGeneratorGUI:
     """Graphical user interface for password generator"""
     
@@ -82,6 +93,19 @@ class PasswordGeneratorGUI:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
     
+    def set_text(self, widget, content):
+        """Replace a text widget's contents in a single edit"""
+        disabled = str(widget.cget('state')) == tk.DISABLED
+        if disabled:
+            widget.config(state=tk.NORMAL)
+        
+        # One replace instead of delete + insert avoids an intermediate relayout
+        widget.replace(1.0, tk.END, content)
+        widget.yview_moveto(0)
+        
+        if disabled:
+            widget.config(state=tk.DISABLED)
+    
     def get_character_types(self):
         """Get selected character types"""
         char_types = []
@@ -98,8 +122,7 @@ class PasswordGeneratorGUI:
     def generate_password(self):
         """Generate password based on current settings"""
         try:
-            self.generator = PasswordGenerator()
-            
+            # Reuse the generator from __init__; set_* replaces its charset
             custom_chars = self.custom_var.get().strip()
             if custom_chars:
                 self.generator.set_custom_character_set(custom_chars)
@@ -115,16 +138,14 @@ class PasswordGeneratorGUI:
             
             if count == 1:
                 password = self.generator.generate_password(length)
-                self.output_text.delete(1.0, tk.END)
-                self.output_text.insert(tk.END, password)
+                self.set_text(self.output_text, password)
                 
                 # Show strength analysis
                 self.show_strength_analysis(password)
             else:
                 passwords = self.generator.generate_multiple_passwords(length, count)
                 output = "\n".join([f"{i+1}. {pwd}" for i, pwd in enumerate(passwords)])
-                self.output_text.delete(1.0, tk.END)
-                self.output_text.insert(tk.END, output)
+                self.set_text(self.output_text, output)
                 self.clear_strength_analysis()
         
         except ValueError as e:
@@ -136,31 +157,30 @@ class PasswordGeneratorGUI:
         """Show password strength analysis"""
         strength = self.generator.get_password_strength(password)
         
-        analysis = f"Password Strength Analysis:\n\n"
-        analysis += f"Length: {len(password)} characters\n"
-        analysis += f"Contains lowercase: {'✓ Yes' if strength['has_lowercase'] else '✗ No'}\n"
-        analysis += f"Contains uppercase: {'✓ Yes' if strength['has_uppercase'] else '✗ No'}\n"
-        analysis += f"Contains digits: {'✓ Yes' if strength['has_digits'] else '✗ No'}\n"
-        analysis += f"Contains symbols: {'✓ Yes' if strength['has_symbols'] else '✗ No'}\n\n"
-        analysis += f"Overall strength: {'STRONG ✓' if strength['is_strong'] else 'WEAK ✗'}"
-        
-        self.strength_text.config(state=tk.NORMAL)
-        self.strength_text.delete(1.0, tk.END)
-        self.strength_text.insert(tk.END, analysis)
-        self.strength_text.config(state=tk.DISABLED)
+        analysis = _ANALYSIS_TEMPLATE.format_map({
+            'length': len(password),
+            'lowercase': _YES if strength['has_lowercase'] else _NO,
+            'uppercase': _YES if strength['has_uppercase'] else _NO,
+            'digits': _YES if strength['has_digits'] else _NO,
+            'symbols': _YES if strength['has_symbols'] else _NO,
+            'overall': 'STRONG ✓' if strength['is_strong'] else 'WEAK ✗'
+        })
+        
+        self.set_text(self.strength_text, analysis)
     
     def clear_strength_analysis(self):
         """Clear strength analysis display"""
-        self.strength_text.config(state=tk.NORMAL)
-        self.strength_text.delete(1.0, tk.END)
-        self.strength_text.config(state=tk.DISABLED)
+        self.set_text(self.strength_text, "")
     
     def copy_to_clipboard(self):
         """Copy generated password to clipboard"""
         password = self.output_text.get(1.0, tk.END).strip()
         if password:
             try:
-                pyperclip.copy(password)
+                # Tk's own clipboard is in-process; no xclip/xsel subprocess
+                self.root.clipboard_clear()
+                self.root.clipboard_append(password)
+                self.root.update()  # Keep the selection available after closing
                 messagebox.showinfo("Success", "Password copied to clipboard!")
             except Exception as e:
                 messagebox.showerror("Error", f"Could not copy to clipboard: {e}")
@@ -169,7 +189,7 @@ class PasswordGeneratorGUI:
     
     def clear_output(self):
         """Clear output text area"""
-        self.output_text.delete(1.0, tk.END)
+        self.set_text(self.output_text, "")
         self.clear_strength_analysis()
 
 def main():
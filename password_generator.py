@@ -3,10 +3,95 @@ Secure Password Generator Module
 Generates cryptographically secure random passwords
 """
 
+import functools
+import os
+import re
 import secrets
 import string
 from typing import List, Dict
 
+# Precompiled character-class probes; searching stops at the first match.
+# Classes are spelled out so non-ASCII digits and letters are not counted.
+_HAS_LOWER = re.compile('[a-z]').search
+_HAS_UPPER = re.compile('[A-Z]').search
+_HAS_DIGIT = re.compile('[0-9]').search
+_HAS_SYMBOL = re.compile('[' + re.escape(string.punctuation) + ']').search
+
+
+@functools.lru_cache(maxsize=32)
+def _index_tables(n: int):
+    """
+    Build the translate tables used by _random_indices for a range size
+    
+    Cached so repeated sampling from the same range skips rebuilding them.
+    
+    Args:
+        n: Size of the index range (1 to 256)
+        
+    Returns:
+        Tuple of (byte-to-index table, rejected byte values)
+    """
+    limit = 256 - 256 % n
+    table = bytes(b % n for b in range(256))
+    rejected = bytes(range(limit, 256))
+    return table, rejected
+
+
+def _random_indices(n: int, count: int) -> bytes:
+    """
+    Draw uniform random indices in range(n) in one batch
+    
+    Random bytes are read from os.urandom in a single buffer and reduced
+    modulo n with bytes.translate. Bytes at or above the largest multiple
+    of n are discarded (rejection sampling) so each index is equally likely.
+    
+    Args:
+        n: Size of the index range (1 to 256)
+        count: Number of indices to draw
+        
+    Returns:
+        bytes: One index per byte
+    """
+    table, rejected = _index_tables(n)
+    if not rejected:
+        # n divides 256 (a power of two): every byte maps to an index
+        return os.urandom(max(count, 0)).translate(table)
+    
+    # Oversample by 2x so a top-up read is rarely needed
+    out = b''
+    while len(out) < count:
+        out += os.urandom((count - len(out)) * 2).translate(table, rejected)
+    return out[:count]
+
+
+@functools.lru_cache(maxsize=32)
+def _ascii_table(chars: str) -> bytes:
+    """Translate table mapping index i to the ASCII code of chars[i]"""
+    return chars.encode('ascii').ljust(256, b'\0')
+
+
+def _random_chars(chars: str, length: int) -> str:
+    """
+    Draw characters uniformly from a character set in one batch
+    
+    Args:
+        chars: Characters to sample from
+        length: Number of characters to draw
+        
+    Returns:
+        str: Random string of the requested length
+    """
+    n = len(chars)
+    if n > 256:
+        # Too many characters to index with a single byte
+        return ''.join(secrets.choice(chars) for _ in range(length))
+    
+    indices = _random_indices(n, length)
+    if chars.isascii():
+        return indices.translate(_ascii_table(chars)).decode('ascii')
+    return ''.join([chars[i] for i in indices])
+
+
 class PasswordGenerator:
     """Secure password generator with customizable character sets"""
     
@@ -32,14 +117,47 @@ class PasswordGenerator:
                       Options: 'lowercase', 'uppercase', 'digits', 
                               'symbols', 'hex', 'alphanumeric'
         """
-        self.available_chars = ""
-        for char_type in char_types:
-            if char_type in self.CHARACTER_SETS:
-                self.available_chars += self.CHARACTER_SETS[char_type]
+        self.available_chars = "".join([
+            self.CHARACTER_SETS[char_type]
+            for char_type in char_types
+            if char_type in self.CHARACTER_SETS
+        ])
         
         if not self.available_chars:
             raise ValueError("No valid character types specified")
     
+    def configure_character_set(self,
+                                include_lowercase: bool = True,
+                                include_uppercase: bool = True,
+                                include_digits: bool = True,
+                                include_symbols: bool = True,
+                                custom_chars: str = "") -> None:
+        """
+        Configure the character set from individual class toggles
+        
+        Args:
+            include_lowercase: Include lowercase letters
+            include_uppercase: Include uppercase letters
+            include_digits: Include digits
+            include_symbols: Include punctuation symbols
+            custom_chars: Extra characters to append to the set
+        """
+        parts = []
+        if include_lowercase:
+            parts.append(self.CHARACTER_SETS['lowercase'])
+        if include_uppercase:
+            parts.append(self.CHARACTER_SETS['uppercase'])
+        if include_digits:
+            parts.append(self.CHARACTER_SETS['digits'])
+        if include_symbols:
+            parts.append(self.CHARACTER_SETS['symbols'])
+        if custom_chars:
+            parts.append(custom_chars)
+        self.available_chars = "".join(parts)
+        
+        if not self.available_chars:
+            raise ValueError("No character types selected")
+    
     def set_custom_character_set(self, custom_chars: str) -> None:
         """
         Set a custom character set for password generation
@@ -70,9 +188,8 @@ class PasswordGenerator:
         if length < 1:
             raise ValueError("Password length must be at least 1")
         
-        # Use secrets module for cryptographically secure random generation
-        password = ''.join(secrets.choice(self.available_chars) for _ in range(length))
-        return password
+        # Batch-sample from os.urandom, the same source the secrets module uses
+        return _random_chars(self.available_chars, length)
     
     def generate_multiple_passwords(self, length: int = 16, count: int = 5) -> List[str]:
         """
@@ -85,7 +202,12 @@ class PasswordGenerator:
         Returns:
             List[str]: List of generated passwords
         """
-        return [self.generate_password(length) for _ in range(count)]
+        if count < 1:
+            return []
+        
+        # Draw every password's characters in one batch, then split it up
+        block = self.generate_password(length * count)
+        return [block[i:i + length] for i in range(0, len(block), length)]
     
     def get_password_strength(self, password: str) -> Dict[str, bool]:
         """
@@ -97,10 +219,10 @@ class PasswordGenerator:
         Returns:
             Dict with strength indicators
         """
-        has_lower = any(c in string.ascii_lowercase for c in password)
-        has_upper = any(c in string.ascii_uppercase for c in password)
-        has_digit = any(c in string.digits for c in password)
-        has_symbol = any(c in string.punctuation for c in password)
+        has_lower = _HAS_LOWER(password) is not None
+        has_upper = _HAS_UPPER(password) is not None
+        has_digit = _HAS_DIGIT(password) is not None
+        has_symbol = _HAS_SYMBOL(password) is not None
         
         return {
             'length_adequate': len(password) >= 12,